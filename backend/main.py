@@ -9,6 +9,13 @@ from pathlib import Path
 # Import routes
 from .routes import health
 from .routes import brokers
+from .routes import sync
+from .routes import imports
+from .routes import stats
+from .routes import portfolio
+
+from .services.brokers.sync_scheduler import scheduler
+from .services import portfolio as portfolio_service
 
 # Create FastAPI app
 app = FastAPI(
@@ -29,6 +36,29 @@ app.add_middleware(
 # Include routers
 app.include_router(health.router)
 app.include_router(brokers.router)
+app.include_router(sync.router)
+app.include_router(imports.router)
+app.include_router(stats.router)
+app.include_router(portfolio.router)
+
+
+# Background sync lifecycle
+@app.on_event("startup")
+async def start_sync_scheduler():
+    """
+    Start background account sync
+    """
+    await scheduler.start()
+
+
+@app.on_event("shutdown")
+async def stop_sync_scheduler():
+    """
+    Stop background account sync and the portfolio process pool
+    """
+    await scheduler.stop()
+    portfolio_service.shutdown()
+
 
 # Root endpoint
 @app.get("/")
@@ -0,0 +1,71 @@
+"""
+Routes for bulk importing broker statement files
+"""
+
+import asyncio
+
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from pydantic import BaseModel
+from typing import Optional
+
+from ..services.statement_import import import_statement, get_import_progress
+
+router = APIRouter(prefix="/imports", tags=["imports"])
+
+
+# Request/Response models
+class ImportProgressResponse(BaseModel):
+    import_id: str
+    account_id: str
+    filename: str
+    status: str
+    bytes_read: int
+    total_bytes: Optional[int] = None
+    rows_parsed: int
+    trades_found: int
+    trades_imported: int
+    rows_per_second: float
+    error: Optional[str] = None
+
+
+@router.post("/statement", response_model=ImportProgressResponse)
+async def upload_statement(
+    account_id: str = Form(...),
+    file: UploadFile = File(...),
+    import_id: Optional[str] = Form(None)
+):
+    """
+    Import an MT4/MT5 statement export (CSV or HTML) into an account's trades
+
+    The response is only sent once the import has finished. To poll progress
+    from /imports/{import_id} while it runs, clients must generate their own
+    import_id (e.g. a UUID) and send it with the upload; otherwise the id is
+    generated server side and only returned in the final response.
+    """
+    if import_id and get_import_progress(import_id):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Import id already in use")
+
+    # Parsing is CPU bound, keep it off the event loop
+    result = await asyncio.to_thread(
+        import_statement,
+        file.file,
+        account_id,
+        filename=file.filename or "",
+        total_bytes=file.size,
+        import_id=import_id
+    )
+
+    if result["status"] == "failed":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result["error"])
+    return result
+
+
+@router.get("/{import_id}", response_model=ImportProgressResponse)
+async def get_import(import_id: str):
+    """
+    Get progress of a statement import
+    """
+    progress = get_import_progress(import_id)
+    if not progress:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import not found")
+    return progress
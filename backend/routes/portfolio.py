@@ -0,0 +1,21 @@
+"""
+Routes for multi-account portfolio dashboards
+"""
+
+from fastapi import APIRouter, Query
+from typing import List, Optional
+
+from ..services.portfolio import get_portfolio
+
+router = APIRouter(prefix="/portfolio", tags=["portfolio"])
+
+
+@router.get("")
+def get_portfolio_stats(
+    account_ids: Optional[List[str]] = Query(None),
+    initial_balance: float = Query(0.0)
+):
+    """
+    Get combined and per-account stats (all accounts with stored trades if none given)
+    """
+    return get_portfolio(account_ids=account_ids, initial_balance=initial_balance)
@@ -0,0 +1,53 @@
+"""
+Routes for trading statistics over locally stored trades
+"""
+
+from fastapi import APIRouter, HTTPException, status, Query
+from pydantic import BaseModel
+from typing import List, Dict, Any
+
+from ..services import trade_store
+from ..services.stats import Stats
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+# Request/Response models
+class RollingMetricsResponse(BaseModel):
+    window: int
+    metrics: List[Dict[str, Any]]
+
+
+@router.get("/{account_id}/performance")
+def get_performance(
+    account_id: str,
+    initial_balance: float = Query(0.0),
+    server_utc_offset: float = Query(0.0)
+):
+    """
+    Get performance metrics (equity curve, drawdown, streaks, breakdowns) for an account
+
+    Pass the broker's server_utc_offset (hours) so per-session stats use UTC sessions,
+    and the account's initial_balance to get max_drawdown_percent (null otherwise).
+    """
+    trades = trade_store.load_trades(account_id)
+    return Stats.get_performance_metrics(
+        trades,
+        initial_balance=initial_balance,
+        server_utc_offset=server_utc_offset
+    )
+
+
+@router.get("/{account_id}/rolling", response_model=RollingMetricsResponse)
+def get_rolling(account_id: str, window: int = Query(20)):
+    """
+    Get rolling win rate, profit factor and expectancy for an account
+    """
+    if window <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Window must be a positive number of trades"
+        )
+
+    trades = trade_store.load_trades(account_id)
+    return {"window": window, "metrics": Stats.get_rolling_metrics(trades, window=window)}
@@ -0,0 +1,98 @@
+"""
+Routes for background account sync and locally stored trades
+"""
+
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel
+from typing import List, Dict, Any, Optional
+
+from ..services import trade_store
+from ..services.brokers.sync_scheduler import scheduler, DEFAULT_INTERVAL_SECONDS, DEFAULT_JITTER
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+# Request/Response models
+class RegisterAccountRequest(BaseModel):
+    account_id: str
+    host: str = "localhost"
+    port: int = 9876
+    interval: float = DEFAULT_INTERVAL_SECONDS
+    jitter: float = DEFAULT_JITTER
+
+
+class AccountSyncStatus(BaseModel):
+    account_id: str
+    host: str
+    port: int
+    interval: float
+    running: bool
+    failures: int
+    last_success: Optional[str] = None
+    last_error: Optional[str] = None
+    last_count: int = 0
+
+
+class AccountSyncListResponse(BaseModel):
+    accounts: List[AccountSyncStatus]
+
+
+class TradesResponse(BaseModel):
+    trades: List[Dict[str, Any]]
+
+
+@router.get("/accounts", response_model=AccountSyncListResponse)
+async def get_accounts():
+    """
+    List accounts registered for background sync
+    """
+    return {"accounts": scheduler.get_status()}
+
+
+@router.post("/accounts", response_model=AccountSyncStatus)
+async def register_account(request: RegisterAccountRequest):
+    """
+    Register an account for background sync
+    """
+    if request.interval <= 0 or not 0 <= request.jitter < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Interval must be positive and jitter between 0 and 1"
+        )
+
+    account = scheduler.add_account(
+        request.account_id,
+        host=request.host,
+        port=request.port,
+        interval=request.interval,
+        jitter=request.jitter
+    )
+    return account.to_dict()
+
+
+@router.delete("/accounts/{account_id}")
+async def unregister_account(account_id: str):
+    """
+    Stop background sync for an account
+    """
+    if not scheduler.remove_account(account_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not registered")
+    return {"success": True}
+
+
+@router.post("/accounts/{account_id}/run", response_model=AccountSyncStatus)
+async def run_account_sync(account_id: str):
+    """
+    Sync an account now, or wait for the sync already in progress
+    """
+    if account_id not in scheduler.accounts:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not registered")
+    return await scheduler.trigger(account_id)
+
+
+@router.get("/accounts/{account_id}/trades", response_model=TradesResponse)
+def get_account_trades(account_id: str):
+    """
+    Get locally stored trades for an account
+    """
+    return {"trades": trade_store.load_trades(account_id)}
@@ -0,0 +1,344 @@
+"""
+Background sync scheduler for MT4/MT5 accounts
+Periodically pulls closed trades from each account's MT terminal into the local
+trade store, so API requests only ever read local data
+"""
+
+import asyncio
+import logging
+import random
+from typing import Dict, List, Any, Optional, Callable
+from datetime import datetime, timedelta
+
+from .mt_client import MTClient, MTClientError
+from .. import trade_store
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_INTERVAL_SECONDS = 300
+DEFAULT_JITTER = 0.1  # +/- 10% of the interval
+MAX_BACKOFF_SECONDS = 3600
+MAX_BACKOFF_EXPONENT = 16  # Keeps 2 ** failures from overflowing a float
+MAX_CONCURRENT_CONNECTIONS = 4
+SYNC_OVERLAP = timedelta(minutes=5)  # Re-fetch window before the newest stored trade
+
+
+class AccountSync:
+    """Sync configuration and runtime state for a single account"""
+
+    def __init__(
+        self,
+        account_id: str,
+        host: str = "localhost",
+        port: int = 9876,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        jitter: float = DEFAULT_JITTER
+    ):
+        """
+        Initialize account sync state
+
+        Args:
+            account_id: Account identifier used in the local trade store
+            host: Host address of the account's MT EA socket server
+            port: Port number of the account's MT EA socket server
+            interval: Seconds between successful syncs
+            jitter: Random fraction of the interval added or removed per run
+        """
+        self.account_id = account_id
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.jitter = jitter
+        self.failures = 0
+        self.last_success: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_count = 0
+        self.next_run_at = 0.0
+        self.current: Optional[asyncio.Task] = None
+        self.loop_task: Optional[asyncio.Task] = None
+        self.wake = asyncio.Event()
+
+    def next_delay(self) -> float:
+        """
+        Seconds until the next run, with jitter and exponential backoff on failures
+
+        Returns:
+            Delay in seconds
+        """
+        delay = self.interval
+        if self.failures:
+            exponent = min(self.failures, MAX_BACKOFF_EXPONENT)
+            # Never back off to less than the normal cadence
+            delay = min(self.interval * (2 ** exponent), max(self.interval, MAX_BACKOFF_SECONDS))
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status of this account's sync for API responses"""
+        return {
+            "account_id": self.account_id,
+            "host": self.host,
+            "port": self.port,
+            "interval": self.interval,
+            "running": self.current is not None and not self.current.done(),
+            "failures": self.failures,
+            "last_success": self.last_success,
+            "last_error": self.last_error,
+            "last_count": self.last_count
+        }
+
+
+class SyncScheduler:
+    """
+    In-process asyncio scheduler that syncs each registered account in the background
+
+    Each account has its own loop and cadence. A global semaphore caps the number
+    of concurrent terminal connections, and a sync requested while another is in
+    flight for the same account is merged into the running one.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_CONNECTIONS,
+        client_factory: Callable[..., MTClient] = MTClient
+    ):
+        """
+        Initialize sync scheduler
+
+        Args:
+            max_concurrent: Maximum number of concurrent terminal connections
+            client_factory: Callable creating an MTClient from host and port
+        """
+        self.max_concurrent = max_concurrent
+        self.client_factory = client_factory
+        self.accounts: Dict[str, AccountSync] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._started = False
+
+    async def start(self) -> None:
+        """Start background sync loops for all registered and persisted accounts"""
+        if self._started:
+            return
+
+        # Restore registrations saved before the last restart
+        for account_id, state in trade_store.get_sync_state().items():
+            if state.get("registered") and account_id not in self.accounts:
+                self.add_account(
+                    account_id,
+                    host=state.get("host", "localhost"),
+                    port=state.get("port", 9876),
+                    interval=state.get("interval", DEFAULT_INTERVAL_SECONDS),
+                    jitter=state.get("jitter", DEFAULT_JITTER)
+                )
+
+        self._started = True
+        for account in self.accounts.values():
+            self._start_loop(account)
+        logger.info(f"Sync scheduler started with {len(self.accounts)} accounts")
+
+    async def stop(self) -> None:
+        """Cancel all background sync loops and wait for them to finish"""
+        self._started = False
+        tasks = []
+        for account in self.accounts.values():
+            for task in (account.loop_task, account.current):
+                if task and not task.done():
+                    task.cancel()
+                    tasks.append(task)
+            account.loop_task = None
+            account.current = None
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Sync scheduler stopped")
+
+    def add_account(
+        self,
+        account_id: str,
+        host: str = "localhost",
+        port: int = 9876,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        jitter: float = DEFAULT_JITTER
+    ) -> AccountSync:
+        """
+        Register an account for background sync, replacing any existing registration
+
+        The registration is persisted with the account's sync state so it
+        survives restarts.
+
+        Args:
+            account_id: Account identifier
+            host: Host address of the account's MT EA socket server
+            port: Port number of the account's MT EA socket server
+            interval: Seconds between successful syncs
+            jitter: Random fraction of the interval added or removed per run
+
+        Returns:
+            The account's sync state
+        """
+        self._stop_account(account_id)
+
+        account = AccountSync(account_id, host=host, port=port, interval=interval, jitter=jitter)
+        persisted = trade_store.update_sync_state(
+            account_id,
+            registered=True,
+            host=host,
+            port=port,
+            interval=interval,
+            jitter=jitter
+        )
+        account.last_success = persisted.get("last_success")
+        self.accounts[account_id] = account
+
+        if self._started:
+            self._start_loop(account)
+        return account
+
+    def remove_account(self, account_id: str) -> bool:
+        """
+        Stop syncing an account
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            True if the account was registered, False otherwise
+        """
+        if not self._stop_account(account_id):
+            return False
+        trade_store.update_sync_state(account_id, registered=False)
+        return True
+
+    def _stop_account(self, account_id: str) -> bool:
+        """Drop an account and cancel its loop without touching persisted state"""
+        account = self.accounts.pop(account_id, None)
+        if not account:
+            return False
+        if account.loop_task and not account.loop_task.done():
+            account.loop_task.cancel()
+        return True
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """
+        Get sync status for all registered accounts
+
+        Returns:
+            List of account sync statuses
+        """
+        return [account.to_dict() for account in self.accounts.values()]
+
+    async def trigger(self, account_id: str) -> Dict[str, Any]:
+        """
+        Run a sync for an account now, or join the one already in flight
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Account sync status after the run
+
+        Raises:
+            KeyError: If the account is not registered
+        """
+        account = self.accounts[account_id]
+        await self._run_once(account)
+        return account.to_dict()
+
+    def _start_loop(self, account: AccountSync) -> None:
+        """Start the background loop for an account"""
+        # Spread first runs so accounts don't all connect at startup
+        account.next_run_at = asyncio.get_running_loop().time() + random.uniform(0, account.interval * account.jitter)
+        account.loop_task = asyncio.create_task(self._account_loop(account))
+
+    async def _account_loop(self, account: AccountSync) -> None:
+        """Wait for each account's next run time and sync it"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                delay = account.next_run_at - loop.time()
+                if delay > 0:
+                    # Woken early when a triggered run reschedules the account
+                    account.wake.clear()
+                    try:
+                        await asyncio.wait_for(account.wake.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self._run_once(account)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Never let one bad run kill the account's loop
+                logger.error(f"Error in sync loop for account {account.account_id}: {e}")
+                account.next_run_at = loop.time() + account.interval
+
+    async def _run_once(self, account: AccountSync) -> None:
+        """Run one sync for an account, merging with a run already in flight"""
+        if account.current is None or account.current.done():
+            account.current = asyncio.create_task(self._sync(account))
+        # Shield so a cancelled caller doesn't abort a run others are waiting on
+        await asyncio.shield(account.current)
+
+    async def _sync(self, account: AccountSync) -> None:
+        """Sync one account and reschedule it"""
+        started_at = datetime.now()
+        try:
+            async with self._semaphore:
+                count = await asyncio.to_thread(self._fetch_and_store, account)
+        except MTClientError as e:
+            account.failures += 1
+            account.last_error = str(e)
+            logger.warning(f"Sync failed for account {account.account_id} (failure {account.failures}): {e}")
+        except Exception as e:
+            account.last_error = str(e)
+            logger.error(f"Unexpected error syncing account {account.account_id}: {e}")
+        else:
+            account.failures = 0
+            account.last_error = None
+            account.last_count = count
+            account.last_success = started_at.isoformat()
+            logger.info(f"Synced {count} new trades for account {account.account_id}")
+        finally:
+            await asyncio.to_thread(
+                trade_store.update_sync_state,
+                account.account_id,
+                last_success=account.last_success,
+                last_error=account.last_error,
+                failures=account.failures
+            )
+            account.next_run_at = asyncio.get_running_loop().time() + account.next_delay()
+            account.wake.set()
+
+    def _fetch_and_store(self, account: AccountSync) -> int:
+        """
+        Fetch closed trades from the terminal and store them (runs in a worker thread)
+
+        Returns:
+            Number of new trades stored
+
+        Raises:
+            MTClientError: If the terminal can't be reached or the command fails
+        """
+        # Use the newest stored trade (terminal clock) rather than the host clock,
+        # since MT filters history by broker server time
+        from_date = None
+        latest = trade_store.get_latest_trade_date(account.account_id)
+        if latest:
+            from_date = latest - SYNC_OVERLAP
+
+        client = self.client_factory(host=account.host, port=account.port)
+        if not client.connect():
+            raise MTClientError(f"Could not connect to MT terminal: {client.last_error}")
+        try:
+            raw_trades = client.get_closed_trades(from_date=from_date)
+        finally:
+            client.disconnect()
+
+        trades = [t for t in (trade_store.normalize_trade(raw) for raw in raw_trades) if t]
+        return trade_store.save_trades(account.account_id, trades)
+
+
+# Shared scheduler used by the API
+scheduler = SyncScheduler()
@@ -0,0 +1,313 @@
+"""
+Portfolio service for multi-account aggregation
+Computes a mergeable partial result per account (in a process pool for large
+histories), caches it until the account's trades change, and combines partials
+with associative reductions instead of concatenating raw trade lists
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Dict, List, Any, Optional
+from datetime import date as date_type, datetime, timedelta
+
+from . import trade_store
+from .stats import Stats, TradeOutcome
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+PARALLEL_MIN_BYTES = 5 * 1024 * 1024  # Accounts larger than this are computed in the process pool
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Cached partial results keyed by account id, with the trade file signature they were built from
+_partial_cache: Dict[str, Dict[str, Any]] = {}
+_cache_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def empty_partial() -> Dict[str, Any]:
+    """
+    Identity element for merge_partials
+
+    Returns:
+        Partial result with no trades
+    """
+    return {
+        "total_trades": 0,
+        "win_count": 0,
+        "loss_count": 0,
+        "breakeven_count": 0,
+        "gross_profit": 0.0,
+        "gross_loss": 0.0,
+        "weekly": {},
+        "daily": {},
+        # Trade-level drawdown of a single account; not mergeable across accounts
+        "max_drawdown": None
+    }
+
+
+def compute_partial(account_id: str) -> Dict[str, Any]:
+    """
+    Compute the mergeable partial result for one account
+
+    Runs in a worker process for large accounts, so it loads trades itself
+    rather than receiving them from the caller.
+
+    Args:
+        account_id: Account identifier
+
+    Returns:
+        Partial result with outcome counts, gross profit/loss, weekly buckets
+        keyed by week start, daily P&L keyed by date and the account's
+        trade-level max drawdown
+    """
+    partial = empty_partial()
+    weekly = partial["weekly"]
+    daily = partial["daily"]
+    win, loss = TradeOutcome.WIN.value, TradeOutcome.LOSS.value
+    equity = peak = max_drawdown = 0.0
+
+    for _, trade in Stats.order_trades(trade_store.load_trades(account_id)):
+        profit = trade.get("profit", 0)
+        outcome = trade.get("outcome")
+        # Bucket by the trade's own wall-clock date, as Stats.get_weekly_trades does
+        date = date_type.fromisoformat(trade["date"][:10])
+
+        # Same per-trade drawdown as Stats.get_performance_metrics
+        equity += profit
+        peak = max(peak, equity)
+        max_drawdown = max(max_drawdown, peak - equity)
+        week_start = (date - timedelta(days=date.weekday())).isoformat()
+
+        week = weekly.get(week_start)
+        if week is None:
+            week = weekly[week_start] = {
+                "total_trades": 0, "win_count": 0, "loss_count": 0, "breakeven_count": 0, "total_profit": 0.0
+            }
+        week["total_trades"] += 1
+        week["total_profit"] += profit
+
+        if outcome == win:
+            partial["win_count"] += 1
+            week["win_count"] += 1
+        elif outcome == loss:
+            partial["loss_count"] += 1
+            week["loss_count"] += 1
+        else:
+            partial["breakeven_count"] += 1
+            week["breakeven_count"] += 1
+
+        if profit > 0:
+            partial["gross_profit"] += profit
+        else:
+            partial["gross_loss"] -= profit
+
+        day = date.isoformat()
+        daily[day] = daily.get(day, 0.0) + profit
+
+    partial["total_trades"] = partial["win_count"] + partial["loss_count"] + partial["breakeven_count"]
+    partial["max_drawdown"] = max_drawdown
+    return partial
+
+
+def merge_partials(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge two partial results
+
+    Every merged field is a sum or a keyed sum, so merging is associative and
+    commutative and partials can be combined in any order. The trade-level
+    max_drawdown can't be merged and is dropped.
+
+    Args:
+        a: First partial result
+        b: Second partial result
+
+    Returns:
+        New merged partial result
+    """
+    return _merge_into(_merge_into(empty_partial(), a), b)
+
+
+def _merge_into(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+    """Add a partial result into target in place"""
+    for key in ("total_trades", "win_count", "loss_count", "breakeven_count", "gross_profit", "gross_loss"):
+        target[key] += source[key]
+
+    weekly = target["weekly"]
+    for week_start, week in source["weekly"].items():
+        bucket = weekly.get(week_start)
+        if bucket is None:
+            bucket = weekly[week_start] = dict.fromkeys(week, 0)
+        for field, value in week.items():
+            bucket[field] += value
+
+    daily = target["daily"]
+    for day, profit in source["daily"].items():
+        daily[day] = daily.get(day, 0.0) + profit
+
+    return target
+
+
+def summarize_partial(partial: Dict[str, Any], initial_balance: float = 0.0) -> Dict[str, Any]:
+    """
+    Turn a partial result into dashboard stats
+
+    Args:
+        partial: Partial result from compute_partial or merge_partials
+        initial_balance: Balance before the first trade, for the equity curve
+
+    Returns:
+        Dict with totals, weekly stats (same shape as Stats.get_weekly_trades),
+        a daily equity curve and its max_daily_drawdown, plus the trade-level
+        max_drawdown for single-account partials
+    """
+    total_trades = partial["total_trades"]
+    gross_profit = partial["gross_profit"]
+    gross_loss = partial["gross_loss"]
+    total_profit = gross_profit - gross_loss
+
+    weekly_stats = []
+    for week_start in sorted(partial["weekly"]):
+        week = partial["weekly"][week_start]
+        week_range = Stats.get_week_range(week_start)
+        weekly_stats.append({
+            "week_start": week_range["week_start"],
+            "week_end": week_range["week_end"],
+            "display_week": week_range["display_week"],
+            "total_trades": week["total_trades"],
+            "win_count": week["win_count"],
+            "loss_count": week["loss_count"],
+            "breakeven_count": week["breakeven_count"],
+            "win_rate": round((week["win_count"] / week["total_trades"]) * 100, 1) if week["total_trades"] else 0,
+            "is_breakeven": Stats.is_breakeven_trade(week["total_profit"], threshold=1.0),
+            "total_profit": round(week["total_profit"], 2)
+        })
+
+    equity = peak = initial_balance
+    max_daily_drawdown = 0.0
+    equity_curve = []
+    for day in sorted(partial["daily"]):
+        equity += partial["daily"][day]
+        peak = max(peak, equity)
+        drawdown = peak - equity
+        max_daily_drawdown = max(max_daily_drawdown, drawdown)
+        equity_curve.append({"date": day, "equity": round(equity, 2), "drawdown": round(drawdown, 2)})
+
+    summary = {
+        "total_trades": total_trades,
+        "win_count": partial["win_count"],
+        "loss_count": partial["loss_count"],
+        "breakeven_count": partial["breakeven_count"],
+        "win_rate": round((partial["win_count"] / total_trades) * 100, 1) if total_trades else 0,
+        "total_profit": round(total_profit, 2),
+        "profit_factor": round(gross_profit / gross_loss, 2) if gross_loss else None,
+        "expectancy": round(total_profit / total_trades, 2) if total_trades else 0,
+        "max_daily_drawdown": round(max_daily_drawdown, 2),
+        "weekly": weekly_stats,
+        "equity_curve": equity_curve
+    }
+    if partial["max_drawdown"] is not None:
+        summary["max_drawdown"] = round(partial["max_drawdown"], 2)
+    return summary
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared process pool"""
+    global _executor
+    if _executor is None:
+        # Spawn rather than fork: forking the threaded server can copy held locks into workers
+        _executor = ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def shutdown() -> None:
+    """Shut down the process pool"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+def get_partials(account_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get partial results for accounts, recomputing only those whose trades changed
+
+    Stale accounts with large histories are computed in parallel in the process
+    pool, smaller ones inline.
+
+    Args:
+        account_ids: Account identifiers
+
+    Returns:
+        Partial results keyed by account id
+    """
+    partials = {}
+    stale = {}
+    with _cache_lock:
+        for account_id in account_ids:
+            signature = trade_store.get_trades_signature(account_id)
+            cached = _partial_cache.get(account_id)
+            if cached and cached["signature"] == signature:
+                partials[account_id] = cached["partial"]
+            else:
+                stale[account_id] = signature
+
+    if not stale:
+        return partials
+
+    large = [a for a, sig in stale.items() if sig and sig[0] >= PARALLEL_MIN_BYTES]
+    futures = {}
+    if len(large) > 1:
+        executor = _get_executor()
+        futures = {account_id: executor.submit(compute_partial, account_id) for account_id in large}
+
+    computed = {}
+    for account_id in stale:
+        if account_id not in futures:
+            computed[account_id] = compute_partial(account_id)
+    for account_id, future in futures.items():
+        computed[account_id] = future.result()
+
+    logger.info(f"Recomputed portfolio partials for {len(computed)} of {len(account_ids)} accounts")
+
+    with _cache_lock:
+        for account_id, partial in computed.items():
+            _partial_cache[account_id] = {"signature": stale[account_id], "partial": partial}
+    partials.update(computed)
+    return partials
+
+
+def get_portfolio(
+    account_ids: Optional[List[str]] = None,
+    initial_balance: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Get per-account and combined stats for a set of accounts
+
+    Args:
+        account_ids: Account identifiers (all accounts with stored trades if not provided)
+        initial_balance: Combined balance before the first trade
+
+    Returns:
+        Dict with per-account summaries and a combined summary
+    """
+    if account_ids is None:
+        account_ids = trade_store.list_accounts()
+
+    partials = get_partials(account_ids)
+    combined = reduce(merge_partials, (partials[a] for a in account_ids), empty_partial())
+
+    return {
+        "accounts": {account_id: summarize_partial(partials[account_id]) for account_id in account_ids},
+        "combined": summarize_partial(combined, initial_balance=initial_balance),
+        "generated_at": datetime.now().isoformat()
+    }
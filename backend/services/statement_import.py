@@ -0,0 +1,365 @@
+"""
+Bulk import of MT4/MT5 broker statement exports (CSV and HTML)
+Parses statement files as a stream and writes normalized trades to the local
+trade store in batches
+"""
+
+import csv
+import codecs
+import logging
+import time
+import uuid
+from html.parser import HTMLParser
+from typing import Dict, List, Any, Optional, Iterator, BinaryIO
+
+from . import trade_store
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+CHUNK_SIZE = 64 * 1024
+BATCH_SIZE = 5000
+TRADE_TYPES = ("buy", "sell")
+NUMERIC_FIELDS = ("profit", "commission", "swap", "volume")
+NO_HEADER_ERROR = "No closed trades table found in statement"
+PROGRESS_TTL_SECONDS = 3600  # How long finished imports stay available for polling
+
+# Statement column names mapped to raw trade keys understood by normalize_trade
+COLUMN_ALIASES = {
+    "ticket": "ticket",
+    "order": "ticket",
+    "position": "ticket",
+    "id": "ticket",
+    "item": "symbol",
+    "symbol": "symbol",
+    "type": "type",
+    "size": "volume",
+    "volume": "volume",
+    "lots": "volume",
+    "open time": "open_time",
+    "close time": "close_time",
+    "date": "close_time",
+    "commission": "commission",
+    "swap": "swap",
+    "profit": "profit"
+}
+
+# Progress of running and finished imports, keyed by import id
+_imports: Dict[str, Dict[str, Any]] = {}
+# Finish time of completed imports, used to expire their progress
+_finished_at: Dict[str, float] = {}
+
+
+def map_header(cells: List[str]) -> Optional[List[Optional[str]]]:
+    """
+    Map a statement header row to raw trade keys
+
+    MT statements use "Time" and "Price" twice (open then close), so the second
+    "Time" column is taken as the close time.
+
+    Args:
+        cells: Header cell texts
+
+    Returns:
+        Raw trade key per column (None for ignored columns), or None if the row
+        is not a closed trades header
+    """
+    keys: List[Optional[str]] = []
+    for cell in cells:
+        name = " ".join(cell.lower().split())
+        if name == "time":
+            key = "close_time" if "open_time" in keys else "open_time"
+        else:
+            key = COLUMN_ALIASES.get(name)
+        keys.append(key if key not in keys else None)
+
+    if "close_time" not in keys or "profit" not in keys:
+        return None
+    return keys
+
+
+def row_to_trade(keys: List[Optional[str]], cells: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a statement row into a raw trade using a mapped header
+
+    Args:
+        keys: Raw trade key per column from map_header
+        cells: Row cell texts
+
+    Returns:
+        Raw trade dictionary with numeric fields as floats, or None if the row
+        is not a closed buy/sell trade
+    """
+    if len(cells) != len(keys):
+        return None
+
+    raw = {key: cell.strip() for key, cell in zip(keys, cells) if key}
+    if "type" in raw and raw["type"].lower() not in TRADE_TYPES:
+        return None
+    if not raw.get("close_time"):
+        return None
+
+    for field in NUMERIC_FIELDS:
+        if raw.get(field):
+            # Statements may group thousands with spaces
+            try:
+                raw[field] = float(raw[field].replace(" ", "").replace("\xa0", ""))
+            except ValueError:
+                return None
+    return raw
+
+
+class _StatementHTMLParser(HTMLParser):
+    """Incremental parser collecting closed trade rows from an HTML statement"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[Dict[str, Any]] = []
+        self.row_count = 0
+        self.header_found = False
+        self._keys: Optional[List[Optional[str]]] = None
+        self._cells: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "tr":
+            self._cells = []
+        elif tag in ("td", "th") and self._cells is not None:
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th") and self._cell is not None:
+            self._cells.append("".join(self._cell))
+            self._cell = None
+        elif tag == "tr" and self._cells is not None:
+            self._handle_row(self._cells)
+            self._cells = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _handle_row(self, cells: List[str]) -> None:
+        keys = map_header(cells)
+        if keys:
+            self._keys = keys
+            self.header_found = True
+            return
+        # A section title row ("Open Trades:", "Orders", "Deals") ends the current table
+        if sum(1 for c in cells if c.strip()) == 1:
+            self._keys = None
+            return
+        if self._keys:
+            self.row_count += 1
+            raw = row_to_trade(self._keys, cells)
+            if raw:
+                self.rows.append(raw)
+
+
+def _iter_text(fileobj: BinaryIO, progress: Dict[str, Any]) -> Iterator[str]:
+    """
+    Read a binary file in chunks and decode it incrementally
+
+    MT5 reports are usually UTF-16 with a BOM, MT4 statements UTF-8 or ANSI.
+    """
+    first = fileobj.read(CHUNK_SIZE)
+    if first.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = "utf-16"
+    elif first.startswith(codecs.BOM_UTF8):
+        encoding = "utf-8-sig"
+    else:
+        encoding = "utf-8"
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    chunk = first
+    while chunk:
+        progress["bytes_read"] += len(chunk)
+        yield decoder.decode(chunk)
+        chunk = fileobj.read(CHUNK_SIZE)
+    yield decoder.decode(b"", final=True)
+
+
+def _iter_lines(chunks: Iterator[str]) -> Iterator[str]:
+    """Split decoded text chunks into lines"""
+    pending = ""
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(keepends=True)
+        # Hold back an unterminated line, or a trailing "\r" whose "\n" may be in the next chunk
+        pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        yield from lines
+    if pending:
+        yield pending
+
+
+def parse_csv(fileobj: BinaryIO, progress: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw trades from a CSV statement export
+
+    Args:
+        fileobj: Binary file object
+        progress: Progress dictionary updated with bytes read and rows parsed
+
+    Yields:
+        Raw trade dictionaries
+
+    Raises:
+        ValueError: If the file has no closed trades header
+    """
+    lines = _iter_lines(_iter_text(fileobj, progress))
+    keys = None
+    delimiter = ","
+    for line in lines:
+        if not line.strip():
+            continue
+        # Exports use comma, semicolon or tab depending on terminal locale
+        delimiter = max((",", ";", "\t"), key=line.count)
+        keys = map_header(next(csv.reader([line], delimiter=delimiter)))
+        if keys:
+            break
+
+    if not keys:
+        raise ValueError(NO_HEADER_ERROR)
+
+    for cells in csv.reader(lines, delimiter=delimiter):
+        if not cells:
+            continue
+        progress["rows_parsed"] += 1
+        raw = row_to_trade(keys, cells)
+        if raw:
+            yield raw
+
+
+def parse_html(fileobj: BinaryIO, progress: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw trades from an HTML statement or report
+
+    Args:
+        fileobj: Binary file object
+        progress: Progress dictionary updated with bytes read and rows parsed
+
+    Yields:
+        Raw trade dictionaries
+
+    Raises:
+        ValueError: If the file has no closed trades table
+    """
+    parser = _StatementHTMLParser()
+    for chunk in _iter_text(fileobj, progress):
+        parser.feed(chunk)
+        progress["rows_parsed"] = parser.row_count
+        yield from parser.rows
+        parser.rows = []
+    parser.close()
+    if not parser.header_found:
+        raise ValueError(NO_HEADER_ERROR)
+    yield from parser.rows
+
+
+def import_statement(
+    fileobj: BinaryIO,
+    account_id: str,
+    filename: str = "",
+    total_bytes: Optional[int] = None,
+    import_id: Optional[str] = None,
+    batch_size: int = BATCH_SIZE
+) -> Dict[str, Any]:
+    """
+    Import a statement file into an account's local trade store
+
+    The file is read in chunks and trades are written in batches, so memory use
+    does not grow with the file size. Progress is available from
+    get_import_progress while the import runs.
+
+    Args:
+        fileobj: Binary file object positioned at the start of the statement
+        account_id: Account identifier to import trades into
+        filename: Original file name, used to detect the format
+        total_bytes: File size in bytes, if known
+        import_id: Identifier for progress tracking (generated if not provided)
+        batch_size: Number of trades per storage write
+
+    Returns:
+        Final import progress
+    """
+    _expire_imports()
+    import_id = import_id or uuid.uuid4().hex
+    progress = {
+        "import_id": import_id,
+        "account_id": account_id,
+        "filename": filename,
+        "status": "running",
+        "bytes_read": 0,
+        "total_bytes": total_bytes,
+        "rows_parsed": 0,
+        "trades_found": 0,
+        "trades_imported": 0,
+        "rows_per_second": 0.0,
+        "error": None
+    }
+    _imports[import_id] = progress
+
+    is_html = filename.lower().endswith((".htm", ".html"))
+    if not filename:
+        head = fileobj.read(512)
+        fileobj.seek(0)
+        is_html = b"<" in head.replace(b"\x00", b"")[:64]
+    parse = parse_html if is_html else parse_csv
+
+    started = time.perf_counter()
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        progress["trades_imported"] += trade_store.save_trades(account_id, batch)
+        batch.clear()
+        elapsed = time.perf_counter() - started
+        if elapsed > 0:
+            progress["rows_per_second"] = round(progress["rows_parsed"] / elapsed, 1)
+
+    try:
+        for raw in parse(fileobj, progress):
+            trade = trade_store.normalize_trade(raw)
+            if not trade:
+                continue
+            progress["trades_found"] += 1
+            batch.append(trade)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        progress["status"] = "done"
+        logger.info(
+            f"Imported {progress['trades_imported']} trades from {filename or 'statement'} "
+            f"for account {account_id} ({progress['rows_per_second']} rows/s)"
+        )
+    except (IOError, ValueError, csv.Error) as e:
+        progress["status"] = "failed"
+        progress["error"] = str(e)
+        logger.error(f"Error importing statement for account {account_id}: {e}")
+
+    _finished_at[import_id] = time.time()
+    return dict(progress)
+
+
+def _expire_imports() -> None:
+    """Drop progress of imports that finished more than PROGRESS_TTL_SECONDS ago"""
+    cutoff = time.time() - PROGRESS_TTL_SECONDS
+    for import_id, finished_at in list(_finished_at.items()):
+        if finished_at < cutoff:
+            _finished_at.pop(import_id, None)
+            _imports.pop(import_id, None)
+
+
+def get_import_progress(import_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get progress of a running or finished import
+
+    Args:
+        import_id: Import identifier
+
+    Returns:
+        Import progress, or None if unknown or expired
+    """
+    _expire_imports()
+    progress = _imports.get(import_id)
+    return dict(progress) if progress else None
@@ -4,7 +4,7 @@ Provides methods for calculating various statistics on trading data
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from enum import Enum
 import math
 
@@ -15,6 +15,16 @@ class TradeOutcome(str, Enum):
     BREAKEVEN = "breakeven"
 
 
+# Trading sessions by UTC hour: (name, start hour, end hour)
+# Naive trade dates are broker server time, so pass the server's UTC offset
+# to get_performance_metrics for sessions to line up
+TRADING_SESSIONS = [
+    ("asian", 22, 7),
+    ("london", 7, 12),
+    ("new_york", 12, 22),
+]
+
+
 class Stats:
     """Stats service for trading data analysis"""
 
@@ -168,4 +178,240 @@ class Stats:
         return [
             trade for trade in trades
             if start <= datetime.fromisoformat(trade["date"].replace("Z", "+00:00")) <= end
-        ]
\ No newline at end of file
+        ]
+
+    @staticmethod
+    def parse_trade_date(date_str: str, server_utc_offset: float = 0.0) -> datetime:
+        """
+        Parse a trade date into a naive UTC datetime
+
+        Args:
+            date_str: ISO format date string (optionally with Z or offset)
+            server_utc_offset: UTC offset in hours of dates without an offset
+                (MT terminals report broker server time, usually +2 or +3)
+
+        Returns:
+            Naive datetime in UTC
+        """
+        date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        if date.tzinfo is not None:
+            date = (date - date.utcoffset()).replace(tzinfo=None)
+        elif server_utc_offset:
+            date -= timedelta(hours=server_utc_offset)
+        return date
+
+    @staticmethod
+    def get_trading_session(date: datetime) -> str:
+        """
+        Get the trading session a UTC datetime falls in
+
+        Args:
+            date: Naive UTC datetime
+
+        Returns:
+            Session name (asian, london or new_york)
+        """
+        hour = date.hour
+        for name, start, end in TRADING_SESSIONS:
+            if start <= hour < end or (start > end and (hour >= start or hour < end)):
+                return name
+        return TRADING_SESSIONS[0][0]
+
+    @staticmethod
+    def order_trades(
+        trades: List[Dict[str, Any]],
+        server_utc_offset: float = 0.0
+    ) -> List[Tuple[datetime, Dict[str, Any]]]:
+        """
+        Pair trades with their parsed dates in time order
+
+        Dates are parsed once and the sort is skipped when trades are already
+        time-ordered, which is the common case for stored history.
+
+        Args:
+            trades: List of trade objects
+            server_utc_offset: UTC offset in hours of dates without an offset
+
+        Returns:
+            Time-ordered list of (UTC date, trade) pairs
+        """
+        dated = [(Stats.parse_trade_date(t["date"], server_utc_offset), t) for t in trades]
+        if any(dated[i][0] > dated[i + 1][0] for i in range(len(dated) - 1)):
+            dated.sort(key=lambda x: x[0])
+        return dated
+
+    @staticmethod
+    def get_performance_metrics(
+        trades: List[Dict[str, Any]],
+        initial_balance: float = 0.0,
+        server_utc_offset: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Calculate performance metrics in a single pass over time-ordered trades
+
+        Computes the equity curve, max drawdown, win/loss streaks, profit factor,
+        expectancy and per-symbol/per-session breakdowns together, so cost is
+        linear in the number of trades.
+
+        Args:
+            trades: List of trade objects with date, outcome, profit and symbol
+            initial_balance: Account balance before the first trade; needed for
+                max_drawdown_percent, which is None without a positive balance
+            server_utc_offset: Broker server UTC offset in hours, used to place
+                trades without an explicit offset in the right session
+
+        Returns:
+            Dict of performance metrics
+        """
+        dated_trades = Stats.order_trades(trades, server_utc_offset)
+
+        win_count = loss_count = breakeven_count = 0
+        gross_profit = gross_loss = 0.0
+        equity = peak = initial_balance
+        max_drawdown = max_drawdown_percent = 0.0
+        win_streak = loss_streak = max_win_streak = max_loss_streak = 0
+        equity_curve = []
+        by_symbol: Dict[str, Dict[str, Any]] = {}
+        by_session: Dict[str, Dict[str, Any]] = {}
+        # Plain strings compare faster than enum members in the hot loop
+        win, loss = TradeOutcome.WIN.value, TradeOutcome.LOSS.value
+
+        for date, trade in dated_trades:
+            profit = trade.get("profit", 0)
+            outcome = trade.get("outcome")
+
+            if outcome == win:
+                win_count += 1
+                win_streak += 1
+                loss_streak = 0
+                max_win_streak = max(max_win_streak, win_streak)
+            elif outcome == loss:
+                loss_count += 1
+                loss_streak += 1
+                win_streak = 0
+                max_loss_streak = max(max_loss_streak, loss_streak)
+            else:
+                breakeven_count += 1
+                win_streak = loss_streak = 0
+
+            if profit > 0:
+                gross_profit += profit
+            else:
+                gross_loss -= profit
+
+            # Equity and drawdown from the running peak
+            equity += profit
+            peak = max(peak, equity)
+            drawdown = peak - equity
+            max_drawdown = max(max_drawdown, drawdown)
+            # Tracked separately: the largest percent drawdown need not be the largest absolute one
+            if initial_balance > 0:
+                max_drawdown_percent = max(max_drawdown_percent, drawdown / peak * 100)
+            equity_curve.append({
+                "date": trade["date"],
+                "equity": round(equity, 2),
+                "drawdown": round(drawdown, 2)
+            })
+
+            for groups, key in (
+                (by_symbol, trade.get("symbol") or "unknown"),
+                (by_session, Stats.get_trading_session(date))
+            ):
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = {"total_trades": 0, "win_count": 0, "loss_count": 0, "total_profit": 0.0}
+                group["total_trades"] += 1
+                group["win_count"] += outcome == win
+                group["loss_count"] += outcome == loss
+                group["total_profit"] += profit
+
+        total_trades = len(dated_trades)
+        total_profit = gross_profit - gross_loss
+
+        for groups in (by_symbol, by_session):
+            for group in groups.values():
+                group["win_rate"] = round((group["win_count"] / group["total_trades"]) * 100, 1)
+                group["total_profit"] = round(group["total_profit"], 2)
+
+        current_streak = {"type": None, "count": 0}
+        if win_streak:
+            current_streak = {"type": TradeOutcome.WIN.value, "count": win_streak}
+        elif loss_streak:
+            current_streak = {"type": TradeOutcome.LOSS.value, "count": loss_streak}
+
+        return {
+            "total_trades": total_trades,
+            "win_count": win_count,
+            "loss_count": loss_count,
+            "breakeven_count": breakeven_count,
+            "win_rate": round((win_count / total_trades) * 100, 1) if total_trades else 0,
+            "total_profit": round(total_profit, 2),
+            "gross_profit": round(gross_profit, 2),
+            "gross_loss": round(gross_loss, 2),
+            "profit_factor": round(gross_profit / gross_loss, 2) if gross_loss else None,
+            "average_win": round(gross_profit / win_count, 2) if win_count else 0,
+            "average_loss": round(gross_loss / loss_count, 2) if loss_count else 0,
+            "expectancy": round(total_profit / total_trades, 2) if total_trades else 0,
+            "max_drawdown": round(max_drawdown, 2),
+            # Percent of cumulative profit alone is meaningless, so only report it against a balance
+            "max_drawdown_percent": round(max_drawdown_percent, 1) if initial_balance > 0 else None,
+            "max_win_streak": max_win_streak,
+            "max_loss_streak": max_loss_streak,
+            "current_streak": current_streak,
+            "equity_curve": equity_curve,
+            "by_symbol": by_symbol,
+            "by_session": by_session
+        }
+
+    @staticmethod
+    def get_rolling_metrics(trades: List[Dict[str, Any]], window: int = 20) -> List[Dict[str, Any]]:
+        """
+        Calculate rolling win rate, profit factor and expectancy over the last N trades
+
+        Uses running sums that are updated as trades enter and leave the window,
+        so cost is linear in the number of trades regardless of window size.
+
+        Args:
+            trades: List of trade objects
+            window: Number of trades in each window
+
+        Returns:
+            List of rolling metrics, one per trade once the window is full
+        """
+        if window <= 0:
+            raise ValueError("Window must be a positive number of trades")
+
+        trades = [trade for _, trade in Stats.order_trades(trades)]
+        win = TradeOutcome.WIN.value
+        wins = 0
+        gross_profit = gross_loss = 0.0
+        rolling = []
+
+        for i, trade in enumerate(trades):
+            profit = trade.get("profit", 0)
+            wins += trade.get("outcome") == win
+            if profit > 0:
+                gross_profit += profit
+            else:
+                gross_loss -= profit
+
+            if i >= window:
+                # Drop the trade leaving the window
+                old = trades[i - window]
+                old_profit = old.get("profit", 0)
+                wins -= old.get("outcome") == win
+                if old_profit > 0:
+                    gross_profit -= old_profit
+                else:
+                    gross_loss += old_profit
+
+            if i >= window - 1:
+                rolling.append({
+                    "date": trade["date"],
+                    "win_rate": round((wins / window) * 100, 1),
+                    "total_profit": round(gross_profit - gross_loss, 2),
+                    "profit_factor": round(gross_profit / gross_loss, 2) if gross_loss > 1e-9 else None,
+                    "expectancy": round((gross_profit - gross_loss) / window, 2)
+                })
+
+        return rolling
@@ -0,0 +1,271 @@
+"""
+Local trade storage for the trading journal backend
+Keeps closed trades per account on disk so API reads never touch the MT terminal
+"""
+
+import json
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from datetime import datetime
+from pathlib import Path
+
+from .stats import Stats, TradeOutcome
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+DATA_DIR = Path("data")
+TRADES_DIR = DATA_DIR / "trades"
+SYNC_STATE_PATH = DATA_DIR / "sync_state.json"
+
+# Ensure data directory exists
+TRADES_DIR.mkdir(parents=True, exist_ok=True)
+
+# Guards file appends and the in-memory indexes below
+_lock = threading.Lock()
+
+# Known trade ids per account, used to skip duplicates on overlapping syncs
+_known_ids: Dict[str, set] = {}
+
+# Date of the newest stored trade per account
+_latest_dates: Dict[str, Optional[datetime]] = {}
+
+
+def _account_path(account_id: str) -> Path:
+    """Path of the JSON lines file holding an account's trades"""
+    safe_id = "".join(c for c in str(account_id) if c.isalnum() or c in "-_.")
+    return TRADES_DIR / f"{safe_id}.jsonl"
+
+
+def normalize_trade(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Normalize a raw trade (MT terminal or statement row) into the schema used by Stats
+
+    Args:
+        raw: Raw trade dictionary
+
+    Returns:
+        Normalized trade with id, symbol, date, profit and outcome, or None if
+        the trade has no usable close time
+    """
+    date = raw.get("date") or raw.get("close_time") or raw.get("time_close") or raw.get("time")
+    if not date:
+        return None
+
+    if isinstance(date, datetime):
+        date = date.isoformat()
+    elif isinstance(date, (int, float)):
+        # Unix timestamp in seconds
+        date = datetime.utcfromtimestamp(date).isoformat()
+    else:
+        date = str(date).strip()
+        # MT uses "YYYY.MM.DD HH:MM:SS", convert to ISO format
+        if len(date) >= 10 and date[4] == "." and date[7] == ".":
+            date = date.replace(".", "-", 2)
+        date = date.replace(" ", "T", 1)
+
+    try:
+        datetime.fromisoformat(date.replace("Z", "+00:00"))
+    except ValueError:
+        logger.warning(f"Skipping trade with invalid date: {date}")
+        return None
+
+    try:
+        profit = float(raw.get("profit") or 0)
+        profit += float(raw.get("commission") or 0) + float(raw.get("swap") or 0)
+    except (TypeError, ValueError):
+        logger.warning(f"Skipping trade with invalid profit: {raw.get('profit')}")
+        return None
+
+    if Stats.is_breakeven_trade(profit):
+        outcome = TradeOutcome.BREAKEVEN
+    elif profit > 0:
+        outcome = TradeOutcome.WIN
+    else:
+        outcome = TradeOutcome.LOSS
+
+    trade_id = raw.get("id") or raw.get("ticket") or raw.get("order") or raw.get("position")
+
+    return {
+        "id": str(trade_id) if trade_id is not None else None,
+        "symbol": str(raw.get("symbol") or ""),
+        "type": str(raw.get("type") or ""),
+        "volume": raw.get("volume") or raw.get("lots"),
+        "date": date,
+        "profit": round(profit, 2),
+        "outcome": outcome.value
+    }
+
+
+def _load_known_ids(account_id: str) -> set:
+    """Load (and cache) the set of trade ids and newest trade date already stored for an account"""
+    if account_id not in _known_ids:
+        known = set()
+        latest = None
+        for trade in _iter_file(account_id):
+            if trade.get("id"):
+                known.add(trade["id"])
+            latest = _later(latest, trade["date"])
+        _known_ids[account_id] = known
+        _latest_dates[account_id] = latest
+    return _known_ids[account_id]
+
+
+def _later(latest: Optional[datetime], date_str: str) -> Optional[datetime]:
+    """Return the later of a date and a trade date string"""
+    date = Stats.parse_trade_date(date_str)
+    return date if latest is None or date > latest else latest
+
+
+def _iter_file(account_id: str) -> Iterable[Dict[str, Any]]:
+    """Iterate over stored trades for an account, skipping corrupt lines"""
+    path = _account_path(account_id)
+    if not path.exists():
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt trade line in {path}")
+
+
+def save_trades(account_id: str, trades: Iterable[Dict[str, Any]]) -> int:
+    """
+    Append trades to an account's local store, skipping ones already stored
+
+    Args:
+        account_id: Account identifier
+        trades: Normalized trades to store
+
+    Returns:
+        Number of trades actually written
+    """
+    with _lock:
+        known = _load_known_ids(account_id)
+        lines = []
+        for trade in trades:
+            trade_id = trade.get("id")
+            if trade_id:
+                if trade_id in known:
+                    continue
+                known.add(trade_id)
+            lines.append(json.dumps(trade))
+            _latest_dates[account_id] = _later(_latest_dates.get(account_id), trade["date"])
+
+        if not lines:
+            return 0
+
+        try:
+            with open(_account_path(account_id), 'a') as f:
+                f.write("\n".join(lines) + "\n")
+        except IOError as e:
+            logger.error(f"Error saving trades for account {account_id}: {e}")
+            # Drop the cached ids so they are reloaded from disk next time
+            _known_ids.pop(account_id, None)
+            _latest_dates.pop(account_id, None)
+            raise
+
+        return len(lines)
+
+
+def load_trades(account_id: str) -> List[Dict[str, Any]]:
+    """
+    Load all locally stored trades for an account
+
+    Args:
+        account_id: Account identifier
+
+    Returns:
+        List of normalized trades
+    """
+    return list(_iter_file(account_id))
+
+
+def get_latest_trade_date(account_id: str) -> Optional[datetime]:
+    """
+    Get the close date of the newest stored trade for an account
+
+    Dates are as reported by the terminal, i.e. broker server time.
+
+    Args:
+        account_id: Account identifier
+
+    Returns:
+        Newest trade date, or None if the account has no trades
+    """
+    with _lock:
+        _load_known_ids(account_id)
+        return _latest_dates.get(account_id)
+
+
+def get_trades_signature(account_id: str) -> Optional[Tuple[int, int]]:
+    """
+    Get a signature that changes whenever an account's stored trades change
+
+    Args:
+        account_id: Account identifier
+
+    Returns:
+        Tuple of file size and modification time, or None if the account has no trades
+    """
+    try:
+        stat = _account_path(account_id).stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def list_accounts() -> List[str]:
+    """
+    List account ids that have locally stored trades
+
+    Returns:
+        List of account identifiers
+    """
+    return sorted(path.stem for path in TRADES_DIR.glob("*.jsonl"))
+
+
+def get_sync_state() -> Dict[str, Dict[str, Any]]:
+    """
+    Get persisted sync state for all accounts
+
+    Returns:
+        Dictionary of sync state keyed by account id
+    """
+    try:
+        if SYNC_STATE_PATH.exists():
+            with open(SYNC_STATE_PATH, 'r') as f:
+                return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.error(f"Error loading sync state: {e}")
+    return {}
+
+
+def update_sync_state(account_id: str, **fields: Any) -> Dict[str, Any]:
+    """
+    Update persisted sync state for an account
+
+    Args:
+        account_id: Account identifier
+        **fields: State fields to set (e.g. last_success, last_error)
+
+    Returns:
+        Updated state for the account
+    """
+    with _lock:
+        state = get_sync_state()
+        account_state = state.setdefault(str(account_id), {})
+        account_state.update(fields)
+        try:
+            with open(SYNC_STATE_PATH, 'w') as f:
+                json.dump(state, f, indent=2)
+        except IOError as e:
+            logger.error(f"Error saving sync state: {e}")
+        return account_state
@@ -0,0 +1,16 @@
+import pytest
+
+from backend.services import trade_store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the local trade store at a temporary directory"""
+    trades_dir = tmp_path / "trades"
+    trades_dir.mkdir()
+    monkeypatch.setattr(trade_store, "TRADES_DIR", trades_dir)
+    monkeypatch.setattr(trade_store, "SYNC_STATE_PATH", tmp_path / "sync_state.json")
+    monkeypatch.setattr(trade_store, "_known_ids", {})
+    monkeypatch.setattr(trade_store, "_latest_dates", {})
+    return trade_store
+
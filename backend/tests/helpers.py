@@ -0,0 +1,14 @@
+"""
+Shared helpers for backend tests
+"""
+
+
+def make_trade(date, profit, symbol="EURUSD", trade_id=None):
+    """Build a normalized trade for tests"""
+    if abs(profit) < 0.5:
+        outcome = "breakeven"
+    elif profit > 0:
+        outcome = "win"
+    else:
+        outcome = "loss"
+    return {"id": trade_id, "symbol": symbol, "date": date, "profit": profit, "outcome": outcome}
@@ -0,0 +1,105 @@
+from functools import reduce
+
+from backend.services import portfolio
+from backend.services.portfolio import compute_partial, empty_partial, merge_partials, summarize_partial
+from backend.services.stats import Stats
+from backend.tests.helpers import make_trade
+
+ACCOUNT_TRADES = {
+    "a": [
+        make_trade("2024-01-01T10:00:00", 100, trade_id="a1"),
+        make_trade("2024-01-03T10:00:00", -40, trade_id="a2"),
+        make_trade("2024-01-09T10:00:00", 0.2, trade_id="a3"),
+    ],
+    "b": [
+        make_trade("2024-01-02T10:00:00", -30, trade_id="b1"),
+        make_trade("2024-01-10T10:00:00", 55, trade_id="b2"),
+    ],
+    "c": [
+        make_trade("2024-01-16T10:00:00", 70, trade_id="c1"),
+        make_trade("2024-01-01T12:00:00", -10, trade_id="c2"),
+        # Sunday locally, Monday in UTC: belongs to the week of 2024-01-01
+        make_trade("2024-01-07T23:30:00-05:00", 15, trade_id="c3"),
+    ],
+}
+
+
+def save_accounts(store):
+    for account_id, trades in ACCOUNT_TRADES.items():
+        store.save_trades(account_id, trades)
+
+
+def test_merged_weekly_matches_stats(store):
+    save_accounts(store)
+    partials = [compute_partial(a) for a in ACCOUNT_TRADES]
+    merged = reduce(merge_partials, partials, empty_partial())
+
+    all_trades = [t for trades in ACCOUNT_TRADES.values() for t in trades]
+    expected = Stats.get_weekly_trades(all_trades)
+    for week in expected:
+        week["total_profit"] = round(week["total_profit"], 2)
+    assert summarize_partial(merged)["weekly"] == expected
+
+
+def test_merge_is_associative_and_commutative(store):
+    save_accounts(store)
+    a, b, c = (compute_partial(account_id) for account_id in ACCOUNT_TRADES)
+    left = merge_partials(merge_partials(a, b), c)
+    right = merge_partials(a, merge_partials(c, b))
+    assert left == right
+    # Inputs are left untouched
+    assert a == compute_partial("a")
+
+
+def test_per_account_drawdown_matches_stats(store):
+    save_accounts(store)
+    for account_id, trades in ACCOUNT_TRADES.items():
+        summary = summarize_partial(compute_partial(account_id))
+        assert summary["max_drawdown"] == Stats.get_performance_metrics(trades)["max_drawdown"]
+
+
+def test_combined_summary_has_only_daily_drawdown(store):
+    save_accounts(store)
+    combined = portfolio.get_portfolio(list(ACCOUNT_TRADES))["combined"]
+    assert "max_drawdown" not in combined
+    # Daily equity 90 -> 60 -> 20
+    assert combined["max_daily_drawdown"] == 70
+    assert combined["total_trades"] == 8
+
+
+def test_only_changed_accounts_are_recomputed(store, monkeypatch):
+    save_accounts(store)
+    monkeypatch.setattr(portfolio, "_partial_cache", {})
+    portfolio.get_partials(list(ACCOUNT_TRADES))
+
+    computed = []
+    original = portfolio.compute_partial
+    monkeypatch.setattr(portfolio, "compute_partial", lambda a: computed.append(a) or original(a))
+
+    store.save_trades("b", [make_trade("2024-02-01T10:00:00", 5, trade_id="b3")])
+    partials = portfolio.get_partials(list(ACCOUNT_TRADES))
+    assert computed == ["b"]
+    assert partials["b"]["total_trades"] == 3
+
+
+def test_large_accounts_use_process_pool(tmp_path, monkeypatch, store):
+    # Spawned workers resolve the store's default relative path from the cwd
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(store, "TRADES_DIR", store.DATA_DIR / "trades")
+    store.TRADES_DIR.mkdir(parents=True)
+    save_accounts(store)
+    monkeypatch.setattr(portfolio, "PARALLEL_MIN_BYTES", 1)
+    monkeypatch.setattr(portfolio, "_partial_cache", {})
+
+    submitted = []
+    executor = portfolio._get_executor()
+    original_submit = executor.submit
+    monkeypatch.setattr(executor, "submit", lambda fn, *args: submitted.append(args) or original_submit(fn, *args))
+    try:
+        partials = portfolio.get_partials(list(ACCOUNT_TRADES))
+    finally:
+        portfolio.shutdown()
+
+    assert sorted(args[0] for args in submitted) == sorted(ACCOUNT_TRADES)
+    for account_id in ACCOUNT_TRADES:
+        assert partials[account_id] == compute_partial(account_id)
@@ -0,0 +1,134 @@
+import io
+
+from backend.services import statement_import
+from backend.services.statement_import import import_statement, get_import_progress, map_header, row_to_trade
+
+MT4_HEADER = [
+    "Ticket", "Open Time", "Type", "Size", "Item", "Price", "S / L", "T / P",
+    "Close Time", "Price", "Commission", "Taxes", "Swap", "Profit"
+]
+MT4_ROW = [
+    "1001", "2023.01.02 10:00:00", "buy", "1.00", "eurusd", "1.1000", "0", "0",
+    "2023.01.03 11:00:00", "1.1100", "-7.00", "0.00", "-1.00", "1 000.00"
+]
+MT5_HEADER = [
+    "Time", "Position", "Symbol", "Type", "Volume", "Price", "S / L", "T / P",
+    "Time", "Price", "Commission", "Swap", "Profit"
+]
+MT5_ROW = [
+    "2024.02.01 09:00:00", "555", "GBPUSD", "sell", "0.5", "1.27", "", "",
+    "2024.02.01 15:30:00", "1.26", "-2.5", "0", "50.00"
+]
+
+
+def test_map_header_mt4():
+    keys = map_header(MT4_HEADER)
+    assert keys[0] == "ticket"
+    assert keys[4] == "symbol"
+    assert keys[8] == "close_time"
+    assert keys[13] == "profit"
+    # Second "Price" column is ignored
+    assert keys[9] is None
+
+
+def test_map_header_mt5_uses_second_time_as_close():
+    keys = map_header(MT5_HEADER)
+    assert keys[0] == "open_time"
+    assert keys[8] == "close_time"
+    assert keys[1] == "ticket"
+
+
+def test_map_header_rejects_non_trade_tables():
+    # MT5 orders table has no profit column
+    assert map_header(["Open Time", "Order", "Symbol", "Type", "Volume", "Price", "Time", "State"]) is None
+    assert map_header(["foo", "bar"]) is None
+
+
+def test_row_to_trade_mt4():
+    raw = row_to_trade(map_header(MT4_HEADER), MT4_ROW)
+    assert raw["ticket"] == "1001"
+    assert raw["close_time"] == "2023.01.03 11:00:00"
+    assert raw["profit"] == 1000.0
+    assert raw["volume"] == 1.0
+    assert raw["commission"] == -7.0
+
+
+def test_row_to_trade_mt5():
+    raw = row_to_trade(map_header(MT5_HEADER), MT5_ROW)
+    assert raw["ticket"] == "555"
+    assert raw["symbol"] == "GBPUSD"
+    assert raw["volume"] == 0.5
+    assert raw["profit"] == 50.0
+
+
+def test_row_to_trade_skips_non_trades():
+    keys = map_header(MT4_HEADER)
+    balance = list(MT4_ROW)
+    balance[2] = "balance"
+    assert row_to_trade(keys, balance) is None
+    assert row_to_trade(keys, MT4_ROW[:-1]) is None
+    open_trade = list(MT4_ROW)
+    open_trade[8] = ""
+    assert row_to_trade(keys, open_trade) is None
+
+
+def test_import_csv_detects_delimiter(store):
+    for delimiter in (";", "\t", ","):
+        text = "\n".join(delimiter.join(row) for row in (MT4_HEADER, MT4_ROW)) + "\n"
+        result = import_statement(io.BytesIO(text.encode()), f"acc{ord(delimiter)}", filename="history.csv")
+        assert result["status"] == "done"
+        assert result["trades_imported"] == 1
+
+    trade = store.load_trades(f"acc{ord(';')}")[0]
+    assert trade["date"] == "2023-01-03T11:00:00"
+    assert trade["profit"] == 992.0
+    assert trade["volume"] == 1.0
+
+
+def test_import_html_utf16(store):
+    def row(cells):
+        return "<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>"
+
+    html = (
+        "<html><body><table>"
+        "<tr><td colspan=13>Positions</td></tr>"
+        + row(MT5_HEADER) + row(MT5_ROW)
+        + "<tr><td colspan=13>Deals</td></tr>"
+        + row(["Time", "Deal", "Symbol", "Type", "Direction", "Volume", "Price", "Order",
+               "Commission", "Fee", "Swap", "Profit", "Balance", "Comment"])
+        + row(["2024.02.01 15:30:00", "9", "GBPUSD", "buy", "out", "0.5", "1.26", "10",
+               "0", "0", "0", "50", "1050", ""])
+        + "</table></body></html>"
+    )
+    result = import_statement(io.BytesIO(html.encode("utf-16")), "acc")
+    assert result["status"] == "done"
+    assert result["trades_imported"] == 1
+    assert store.load_trades("acc")[0]["id"] == "555"
+
+
+def test_import_without_trades_header_fails(store):
+    result = import_statement(io.BytesIO(b"PK\x03\x04 not a statement"), "acc", filename="history.xlsx")
+    assert result["status"] == "failed"
+    assert result["error"] == statement_import.NO_HEADER_ERROR
+
+    result = import_statement(io.BytesIO(b"<html><table></table></html>"), "acc", filename="report.html")
+    assert result["status"] == "failed"
+
+
+def test_finished_imports_expire(store, monkeypatch):
+    import_statement(io.BytesIO(b""), "acc", filename="empty.csv", import_id="old")
+    assert get_import_progress("old") is not None
+
+    monkeypatch.setattr(statement_import, "PROGRESS_TTL_SECONDS", -1)
+    assert get_import_progress("old") is None
+    assert "old" not in statement_import._imports
+
+
+def test_crlf_split_across_chunks_is_not_an_extra_row(store, monkeypatch):
+    header = ",".join(MT4_HEADER) + "\r\n"
+    # Put the chunk boundary between "\r" and "\n" at the end of the header
+    monkeypatch.setattr(statement_import, "CHUNK_SIZE", len(header) - 1)
+    text = header + ",".join(MT4_ROW) + "\r\n"
+    result = import_statement(io.BytesIO(text.encode()), "acc", filename="history.csv")
+    assert result["rows_parsed"] == 1
+    assert result["trades_imported"] == 1
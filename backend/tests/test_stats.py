@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from backend.services.stats import Stats
+from backend.tests.helpers import make_trade
+
+
+def trades_from_profits(profits):
+    return [make_trade(f"2024-01-{day:02d}T10:00:00", profit) for day, profit in enumerate(profits, start=1)]
+
+
+def test_drawdown_absolute_and_percent_tracked_independently():
+    metrics = Stats.get_performance_metrics(trades_from_profits([100, -50, 950, -100]), initial_balance=100)
+    assert metrics["max_drawdown"] == 100
+    # -50 from a 200 peak is the larger relative drawdown
+    assert metrics["max_drawdown_percent"] == 25.0
+
+
+def test_drawdown_percent_needs_initial_balance():
+    metrics = Stats.get_performance_metrics(trades_from_profits([1, -1, 5000, -2000]))
+    assert metrics["max_drawdown"] == 2000
+    assert metrics["max_drawdown_percent"] is None
+
+
+def test_drawdown_with_initial_balance():
+    metrics = Stats.get_performance_metrics(trades_from_profits([-200, 100, -300]), initial_balance=1000)
+    assert metrics["max_drawdown"] == 400
+    assert metrics["max_drawdown_percent"] == 40.0
+    assert metrics["equity_curve"][-1]["equity"] == 600
+
+
+def test_streaks():
+    metrics = Stats.get_performance_metrics(trades_from_profits([10, 20, 30, -5, 0, -5, -5, 10]))
+    assert metrics["max_win_streak"] == 3
+    # Breakeven trade resets the loss streak
+    assert metrics["max_loss_streak"] == 2
+    assert metrics["current_streak"] == {"type": "win", "count": 1}
+
+
+def test_profit_factor_and_expectancy():
+    metrics = Stats.get_performance_metrics(trades_from_profits([30, -10, 20, -20]))
+    assert metrics["profit_factor"] == 1.67
+    assert metrics["expectancy"] == 5.0
+    assert metrics["win_rate"] == 50.0
+
+
+def test_unordered_trades_are_sorted():
+    trades = trades_from_profits([100, -50])
+    metrics = Stats.get_performance_metrics(list(reversed(trades)))
+    assert [p["equity"] for p in metrics["equity_curve"]] == [100, 50]
+
+
+def test_sessions_use_server_offset():
+    trades = [make_trade("2024-01-01T09:00:00", 10)]
+    assert list(Stats.get_performance_metrics(trades)["by_session"]) == ["london"]
+    # 09:00 at GMT+3 is 06:00 UTC
+    assert list(Stats.get_performance_metrics(trades, server_utc_offset=3)["by_session"]) == ["asian"]
+
+
+def test_parse_trade_date_offset_only_applies_to_naive_dates():
+    assert Stats.parse_trade_date("2024-01-01T09:00:00", 2) == datetime(2024, 1, 1, 7)
+    assert Stats.parse_trade_date("2024-01-01T09:00:00Z", 2) == datetime(2024, 1, 1, 9)
+
+
+def test_rolling_metrics():
+    rolling = Stats.get_rolling_metrics(trades_from_profits([10, -5, 20, -10]), window=2)
+    assert len(rolling) == 3
+    assert rolling[0]["profit_factor"] == 2.0
+    assert rolling[1]["total_profit"] == 15
+    assert rolling[2]["expectancy"] == 5.0
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime
+
+from backend.services.brokers.mt_client import MTClientError
+from backend.services.brokers.sync_scheduler import (
+    AccountSync,
+    SyncScheduler,
+    MAX_BACKOFF_SECONDS,
+    SYNC_OVERLAP,
+)
+
+
+class FakeClient:
+    """MTClient stand-in recording calls"""
+
+    calls = []
+    fail = False
+
+    def __init__(self, host, port):
+        self.last_error = None
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        return True
+
+    def get_closed_trades(self, from_date=None):
+        FakeClient.calls.append(from_date)
+        if FakeClient.fail:
+            raise MTClientError("terminal unreachable")
+        return [{"ticket": 1, "symbol": "EURUSD", "close_time": "2024.01.02 10:00:00", "profit": 12.5}]
+
+
+def setup_function():
+    FakeClient.calls = []
+    FakeClient.fail = False
+
+
+def test_next_delay_without_failures_uses_interval():
+    account = AccountSync("a", interval=300, jitter=0)
+    assert account.next_delay() == 300
+
+
+def test_next_delay_backs_off_and_is_capped():
+    account = AccountSync("a", interval=300.0, jitter=0)
+    account.failures = 2
+    assert account.next_delay() == 1200
+    account.failures = 1100
+    assert account.next_delay() == MAX_BACKOFF_SECONDS
+
+
+def test_next_delay_never_shorter_than_long_interval():
+    account = AccountSync("a", interval=86400, jitter=0)
+    account.failures = 1
+    assert account.next_delay() == 86400
+    account.failures = 1100
+    assert account.next_delay() == 86400
+
+
+def test_next_delay_jitter_stays_in_bounds():
+    account = AccountSync("a", interval=100, jitter=0.1)
+    for _ in range(100):
+        assert 90 <= account.next_delay() <= 110
+
+
+def test_concurrent_triggers_are_merged(store):
+    async def run():
+        scheduler = SyncScheduler(client_factory=FakeClient)
+        scheduler.add_account("acc", interval=3600)
+        await asyncio.gather(scheduler.trigger("acc"), scheduler.trigger("acc"))
+        return scheduler
+
+    scheduler = asyncio.run(run())
+    assert len(FakeClient.calls) == 1
+    assert scheduler.accounts["acc"].last_count == 1
+    assert store.load_trades("acc")[0]["profit"] == 12.5
+
+
+def test_failures_increase_backoff_and_persist(store):
+    FakeClient.fail = True
+
+    async def run():
+        scheduler = SyncScheduler(client_factory=FakeClient)
+        scheduler.add_account("acc", interval=3600)
+        await scheduler.trigger("acc")
+        await scheduler.trigger("acc")
+        return scheduler
+
+    scheduler = asyncio.run(run())
+    assert scheduler.accounts["acc"].failures == 2
+    assert store.get_sync_state()["acc"]["last_error"] == "terminal unreachable"
+
+
+def test_from_date_uses_newest_stored_trade(store):
+    store.save_trades("acc", [{"id": "1", "date": "2024-03-01T12:00:00", "profit": 1, "outcome": "win"}])
+
+    async def run():
+        scheduler = SyncScheduler(client_factory=FakeClient)
+        scheduler.add_account("acc", interval=3600)
+        await scheduler.trigger("acc")
+
+    asyncio.run(run())
+    assert FakeClient.calls == [datetime(2024, 3, 1, 12) - SYNC_OVERLAP]
+
+
+def test_registrations_survive_restart(store):
+    async def run():
+        first = SyncScheduler(client_factory=FakeClient)
+        first.add_account("kept", port=9000, interval=60)
+        first.add_account("removed")
+        first.remove_account("removed")
+
+        second = SyncScheduler(client_factory=FakeClient)
+        await second.start()
+        await second.stop()
+        return second
+
+    second = asyncio.run(run())
+    assert list(second.accounts) == ["kept"]
+    assert second.accounts["kept"].port == 9000
+    assert second.accounts["kept"].interval == 60